@@ -1,138 +1,318 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from playwright.sync_api import sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import Error as PlaywrightError
+from selectolax.lexbor import LexborHTMLParser
+import httpx
+import asyncio
 import time
-import pandas as pd
+import csv
 import os
+import shutil
 import signal
+import socket
 import sys
 
-# Global variable to store all results for signal handler
-all_results = []
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+LISTING_URL = "https://www.eetimes.com/tag/semiconductors/page/{page}/"
+TOTAL_PAGES = 1824
+
+# Selectors used on every listing page, kept in one place
+SEL_ARTICLE_LINKS = ".segment-one a.article-links, .segment-main a.article-links"
+SEL_SEGMENTS = ".segment-one, .segment-main"
+
+# The browser fallback only needs the DOM - skip everything else
+BLOCKED_RESOURCE_TYPES = {"image", "stylesheet", "font", "media"}
+
+COMPLETE_FILENAME = "eetimes_semiconductors_COMPLETE_all_pages.csv"
+# Streamed to during the run and only moved onto COMPLETE_FILENAME once it succeeds,
+# so a failed re-run never clobbers the last good full list
+PARTIAL_FILENAME = "eetimes_semiconductors_COMPLETE_all_pages.partial.csv"
+
+class AdaptiveThrottle:
+    """Only slows down when the server pushes back or is answering suspiciously fast"""
+    
+    def __init__(self, target_interval=0.2, fast_rtt=0.2, burst=20):
+        self.target_interval = target_interval  # Spacing between requests once throttled
+        self.fast_rtt = fast_rtt  # EMA latency below this counts as "fast"
+        self.burst = burst  # Requests allowed back-to-back before spacing kicks in
+        self.rtt_ema = None
+        self.consecutive = 0
+        self.next_slot = 0.0
+        self.pause_until = 0.0
+    
+    def delay(self):
+        """Reserve the next request slot and return how long to wait for it"""
+        now = time.monotonic()
+        wait = 0
+        if now < self.pause_until:
+            wait = self.pause_until - now
+        elif self.rtt_ema is not None and self.rtt_ema < self.fast_rtt and self.consecutive > self.burst:
+            wait = max(0, self.next_slot - now)
+        self.next_slot = now + wait + self.target_interval
+        return wait
+    
+    def record(self, elapsed, status_code=None, headers=None):
+        """Feed back one request's latency and (if any) its HTTP response"""
+        self.rtt_ema = elapsed if self.rtt_ema is None else 0.8 * self.rtt_ema + 0.2 * elapsed
+        self.consecutive += 1
+        
+        headers = headers or {}
+        if status_code == 429 or headers.get("X-RateLimit-Remaining") == "0":
+            retry_after = headers.get("Retry-After", "")
+            backoff = int(retry_after) if retry_after.isdigit() else 5
+            print(f"   ⏳ Rate limited, pausing {backoff}s")
+            self.pause_until = time.monotonic() + backoff
+            self.consecutive = 0
+
+# Every unique URL found so far is streamed to PARTIAL_FILENAME as it comes in;
+# only the set of seen URLs stays in memory for de-duplication
+all_results_file = None
+all_results_writer = None
+all_results_set = set()
+total_found = 0
 current_page = 1
+throttle = AdaptiveThrottle()
+
+def open_results_file():
+    """Start the on-disk file that all found URLs are appended to"""
+    global all_results_file, all_results_writer
+    all_results_file = open(PARTIAL_FILENAME, "w", newline="", encoding="utf-8")
+    all_results_writer = csv.writer(all_results_file)
+    all_results_writer.writerow(["URL"])
+
+def record_results(page_results):
+    """Append one page's not-yet-seen URLs to the on-disk results file"""
+    global total_found
+    for href in page_results:
+        if href not in all_results_set:
+            all_results_set.add(href)
+            all_results_writer.writerow([href])
+            total_found += 1
+
+def prewarm_dns(host="www.eetimes.com"):
+    """Resolve the host once before the concurrent fetches start"""
+    try:
+        socket.getaddrinfo(host, 443, socket.AF_INET, socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        print(f"⚠️  DNS prewarm failed for {host}: {e}")
 
 def signal_handler(sig, frame):
     """Handle Ctrl+C gracefully by saving current progress"""
     print('\n🛑 Interrupted! Saving current progress...')
-    if all_results:
-        df = pd.DataFrame(all_results, columns=["URL"])
-        df = df.drop_duplicates(subset="URL")
+    if total_found:
+        # The running file is already de-duplicated, so a copy is all that's needed
+        all_results_file.flush()
         filename = f"eetimes_semiconductors_interrupted_page_{current_page}.csv"
-        df.to_csv(filename, index=False)
-        print(f"💾 Saved {len(df)} articles to {filename} before exiting")
+        shutil.copy(PARTIAL_FILENAME, filename)
+        print(f"💾 Saved {total_found} articles to {filename} before exiting")
     sys.exit(0)
 
-def setup_driver():
-    """Setup optimized Chrome driver"""
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-images")  # Don't load images (faster)
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+def setup_browser(playwright):
+    """Launch one headless Chromium that lives for the whole run"""
+    # Drop the "controlled by automated software" switch, like excludeSwitches did for Selenium
+    return playwright.chromium.launch(headless=True, ignore_default_args=["--enable-automation"], args=[
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--disable-extensions",
+        
+        # Performance optimizations
+        "--disable-blink-features=AutomationControlled",
+        
+        # Disable logging
+        "--log-level=3",
+        
+        # Add some additional stability options
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+        "--disable-features=TranslateUI",
+        "--disable-ipc-flooding-protection",
+    ])
+
+def block_heavy_resources(route):
+    """Abort images, CSS, fonts and media before they are downloaded"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+def new_browser_context(browser):
+    """Fresh, disposable context + tab - closing it reclaims memory without a Chromium restart"""
+    context = browser.new_context(user_agent=USER_AGENT, java_script_enabled=True)
+    context.route("**/*", block_heavy_resources)
+    tab = context.new_page()
+    tab.set_default_navigation_timeout(30000)
+    return context, tab
+
+def extract_links(tree, page_num):
+    """Pull article URLs out of a parsed listing page"""
+    results = []
     
-    # Performance optimizations
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
+    # Look for article-links within segment-one or segment-main
+    links = tree.css(SEL_ARTICLE_LINKS)
+    if links:
+        print(f"   ✅ Found {len(links)} article links on page {page_num}")
+        
+        for link in links:
+            href = link.attributes.get("href")
+            text = link.text().strip()
+            
+            # Clean and validate
+            if href and text and len(text) > 10:  # Reasonable title length
+                # Ensure absolute URL
+                if href.startswith('/'):
+                    href = 'https://www.eetimes.com' + href
+                
+                # Only append the URL now
+                results.append(href)
+    else:
+        print(f"   ⚠️  No article links found on page {page_num}")
     
-    # Disable logging
-    options.add_argument("--log-level=3")
-    options.add_experimental_option("excludeSwitches", ["enable-logging"])
-    options.add_experimental_option('useAutomationExtension', False)
+    return results
+
+async def load_page(client, url):
+    """GET a listing page through the throttle, retrying a couple of times if the server rate-limits us"""
+    for _ in range(3):
+        await asyncio.sleep(throttle.delay())
+        start = time.monotonic()
+        response = await client.get(url)
+        throttle.record(time.monotonic() - start, response.status_code, response.headers)
+        if response.status_code != 429:
+            break
+    return response
+
+async def fetch_page(client, sem, page_num, queue=None):
+    """Scrape a listing page over plain HTTP, at most `sem` pages in flight"""
+    url = LISTING_URL.format(page=page_num)
+    results = []
     
-    # Add some additional stability options
-    options.add_argument("--disable-background-timer-throttling")
-    options.add_argument("--disable-backgrounding-occluded-windows")
-    options.add_argument("--disable-renderer-backgrounding")
-    options.add_argument("--disable-features=TranslateUI")
-    options.add_argument("--disable-ipc-flooding-protection")
+    async with sem:
+        print(f"🔎 Scraping page {page_num}: {url}")
+        try:
+            response = await load_page(client, url)
+            response.raise_for_status()
+            
+            # Listing HTML is server-rendered, no JavaScript needed
+            tree = LexborHTMLParser(response.content)
+            results = extract_links(tree, page_num)
+            
+        except httpx.TimeoutException:
+            print(f"   ❌ Timeout loading page {page_num}")
+        except httpx.HTTPError as e:
+            print(f"   ❌ HTTP error on page {page_num}: {str(e)[:100]}")
+        except Exception as e:
+            print(f"   ❌ Unexpected error on page {page_num}: {str(e)[:100]}")
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
+    if queue is not None:
+        await queue.put((page_num, results))
+    return results
+
+async def drain_results(queue):
+    """Collect finished pages and write each 50-page batch once all of its pages are in"""
+    global current_page
+    pending = {}  # batch_num -> {page_num: links}
+    pages_done = 0
     
-    # Set timeouts
-    driver.set_page_load_timeout(30)  # Increased timeout
-    driver.implicitly_wait(10)  # Increased implicit wait
+    while True:
+        item = await queue.get()
+        if item is None:
+            break
+        
+        page_num, page_results = item
+        record_results(page_results)
+        pages_done += 1
+        current_page = pages_done
+        
+        batch_num = (page_num - 1) // 50 + 1
+        batch = pending.setdefault(batch_num, {})
+        batch[page_num] = page_results
+        
+        first_page = (batch_num - 1) * 50 + 1
+        last_page = min(batch_num * 50, TOTAL_PAGES)
+        if len(batch) == last_page - first_page + 1:
+            batch_results = [href for page in sorted(batch) for href in batch[page]]
+            print(f"📊 Completed batch {batch_num}: pages {first_page}-{last_page}")
+            save_progress(batch_results, last_page, batch_num)
+            all_results_file.flush()
+            print(f"📈 Total progress: {pages_done}/{TOTAL_PAGES} pages completed ({total_found} articles found so far)")
+            del pending[batch_num]
+
+async def probe_first_page(client, attempts=3):
+    """
+    Fetch page 1 to decide whether plain HTTP is enough. Returns its links, or None
+    if a 200 response really has none (JS-rendered). Errors are retried, not taken as "needs JS".
+    """
+    url = LISTING_URL.format(page=1)
+    for attempt in range(attempts):
+        print(f"🔎 Scraping page 1: {url}")
+        try:
+            response = await load_page(client, url)
+            if response.status_code == 200:
+                tree = LexborHTMLParser(response.content)
+                return extract_links(tree, 1) or None
+            print(f"   ❌ HTTP {response.status_code} on page 1")
+        except httpx.HTTPError as e:
+            print(f"   ❌ HTTP error on page 1: {str(e)[:100]}")
+        
+        if attempt < attempts - 1:
+            await asyncio.sleep(2 ** attempt)
+    
+    raise RuntimeError(f"Could not load {url} over HTTP after {attempts} attempts")
+
+async def scrape_all_pages(max_concurrency=8):
+    """Scrape every listing page concurrently, returns False if plain HTTP finds nothing"""
+    headers = {"User-Agent": USER_AGENT}
+    async with httpx.AsyncClient(http2=True, timeout=15, headers=headers, follow_redirects=True) as client:
+        sem = asyncio.Semaphore(max_concurrency)
+        
+        # Test if plain HTTP sees the article links before committing to it
+        print("🧪 Testing if a browser is required...")
+        first_page = await probe_first_page(client)
+        if first_page is None:
+            return False
+        
+        # Reuse the probe's result for page 1 instead of fetching it again
+        queue = asyncio.Queue()
+        drainer = asyncio.create_task(drain_results(queue))
+        await queue.put((1, first_page))
+        await asyncio.gather(*[fetch_page(client, sem, page, queue) for page in range(2, TOTAL_PAGES + 1)])
+        await queue.put(None)
+        await drainer
     
-    return driver
+    return True
 
-def scrape_page_with_fallback(driver, url, page_num):
-    """Scrape a page with multiple fallback strategies"""
-    print(f"🔎 Scraping page {page_num}: {url}")
+def scrape_page_with_browser(tab, url, page_num):
+    """Scrape a page through Chromium - only used when plain HTTP finds nothing"""
+    print(f"🔎 Scraping page {page_num} with browser: {url}")
     results = []
     
     try:
         # Load the page
-        driver.get(url)
+        tab.goto(url)
         
         # Wait for content to load - try multiple strategies
-        wait = WebDriverWait(driver, 15)  # Increased wait time
-        
         try:
             # Strategy 1: Wait for article links within specific segments
-            wait.until(EC.any_of(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".segment-one a.article-links")),
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".segment-main a.article-links"))
-            ))
+            tab.wait_for_selector(SEL_ARTICLE_LINKS, state="attached", timeout=15000)
             print(f"   ✅ Page {page_num} loaded with article-links in segments")
-        except TimeoutException:
+        except PlaywrightTimeoutError:
             # Strategy 2: Wait for segment containers
             try:
-                wait.until(EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".segment-one")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".segment-main"))
-                ))
+                tab.wait_for_selector(SEL_SEGMENTS, state="attached", timeout=15000)
                 print(f"   ⚠️  Page {page_num} loaded but no article-links found in segments")
-            except TimeoutException:
+            except PlaywrightTimeoutError:
                 print(f"   ❌ Page {page_num} failed to load properly")
                 return results
         
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        
-        # Look for article-links within segment-one or segment-main
-        selectors = [
-            ".segment-one a.article-links",
-            ".segment-main a.article-links"
-        ]
-        
-        links_found = False
-        for selector in selectors:
-            links = soup.select(selector)
-            if links:
-                print(f"   ✅ Found {len(links)} links with selector: {selector}")
-                
-                for link in links:
-                    href = link.get("href")
-                    text = link.text.strip()
-                    
-                    # Clean and validate
-                    if href and text and len(text) > 10:  # Reasonable title length
-                        # Ensure absolute URL
-                        if href.startswith('/'):
-                            href = 'https://www.eetimes.com' + href
-                        
-                        # Only append the URL now
-                        results.append(href)
-                
-                links_found = True
-        
-        if not links_found:
-            print(f"   ⚠️  No article links found on page {page_num}")
+        # Parse the rendered DOM
+        tree = LexborHTMLParser(tab.content())
+        results = extract_links(tree, page_num)
         
-    except TimeoutException:
+    except PlaywrightTimeoutError:
         print(f"   ❌ Timeout loading page {page_num}")
-    except WebDriverException as e:
-        print(f"   ❌ WebDriver error on page {page_num}: {str(e)[:100]}")
+    except PlaywrightError as e:
+        print(f"   ❌ Browser error on page {page_num}: {str(e)[:100]}")
     except Exception as e:
         print(f"   ❌ Unexpected error on page {page_num}: {str(e)[:100]}")
     
@@ -141,119 +321,114 @@ def scrape_page_with_fallback(driver, url, page_num):
 def save_progress(results, page_num, batch_num=None):
     """Save current progress to CSV"""
     if results:
-        df = pd.DataFrame(results, columns=["URL"])
-        df = df.drop_duplicates(subset="URL")
+        # dict keeps first-seen order while dropping repeats
+        unique_results = list(dict.fromkeys(results))
         
         if batch_num:
             filename = f"eetimes_semiconductors_batch_{batch_num}_pages_{page_num-49}-{page_num}.csv"
         else:
             filename = f"eetimes_semiconductors_final_page_{page_num}.csv"
             
-        df.to_csv(filename, index=False)
-        print(f"💾 Saved {len(df)} articles to {filename}")
+        with open(filename, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["URL"])
+            writer.writerows([href] for href in unique_results)
+        print(f"💾 Saved {len(unique_results)} articles to {filename}")
         return filename
     return None
 
-def main():
-    """Main scraping function with driver restart every 50 pages"""
-    global all_results, current_page
-    
-    # Set up signal handler for Ctrl+C
-    signal.signal(signal.SIGINT, signal_handler)
+def scrape_all_pages_with_browser():
+    """Sequential Chromium fallback, recycling the browser context every 50 pages"""
+    global current_page
     
-    driver = None
+    playwright = None
+    browser = None
+    context = None
     batch_results = []  # Results for current batch
     batch_num = 1
-    js_enabled = False
     
     try:
-        print("🚀 Starting EETimes scraper with auto-restart every 50 pages")
+        playwright = sync_playwright().start()
+        browser = setup_browser(playwright)
         
-        # Scrape all pages from 1 to 1824
-        for page in range(1, 1825):
+        for page in range(1, TOTAL_PAGES + 1):
             current_page = page
             
-            # Start new driver every 50 pages or on first run
+            # Start a new context every 50 pages or on first run
             if (page - 1) % 50 == 0:
-                if driver:
-                    print(f"🔄 Restarting driver after {page-1} pages...")
-                    driver.quit()
-                    time.sleep(2)  # Brief pause between driver sessions
+                if context:
+                    print(f"🔄 Recycling browser context after {page-1} pages...")
+                    context.close()
                 
-                print(f"🚀 Starting driver for batch {batch_num} (pages {page}-{min(page+49, 1824)})")
-                driver = setup_driver()
-                
-                # Test if we need JavaScript on first batch only
-                if batch_num == 1 and not js_enabled:
-                    print("🧪 Testing if JavaScript is required...")
-                    test_results = scrape_page_with_fallback(driver, "https://www.eetimes.com/tag/semiconductors/page/1/", "test")
-                    
-                    if not test_results:
-                        print("🔄 No results without JS, enabling JavaScript...")
-                        driver.quit()
-                        
-                        # Retry with JavaScript enabled
-                        options = Options()
-                        options.add_argument("--headless")
-                        options.add_argument("--no-sandbox")
-                        options.add_argument("--disable-dev-shm-usage")
-                        options.add_argument("--disable-gpu")
-                        options.add_argument("--disable-extensions")
-                        options.add_argument("--disable-images")
-                        options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-                        # Note: JavaScript enabled this time
-                        
-                        service = Service(ChromeDriverManager().install())
-                        driver = webdriver.Chrome(service=service, options=options)
-                        driver.set_page_load_timeout(30)
-                        driver.implicitly_wait(10)
-                        js_enabled = True
+                print(f"🚀 Starting browser context for batch {batch_num} (pages {page}-{min(page+49, TOTAL_PAGES)})")
+                context, tab = new_browser_context(browser)
             
             # Scrape the page
-            url = f"https://www.eetimes.com/tag/semiconductors/page/{page}/"
-            page_results = scrape_page_with_fallback(driver, url, page)
+            url = LISTING_URL.format(page=page)
+            time.sleep(throttle.delay())
+            start = time.monotonic()
+            page_results = scrape_page_with_browser(tab, url, page)
+            throttle.record(time.monotonic() - start)
             batch_results.extend(page_results)
-            all_results.extend(page_results)
+            record_results(page_results)
             
             # Save batch every 50 pages
             if page % 50 == 0:
                 print(f"📊 Completed batch {batch_num}: pages {page-49}-{page}")
                 save_progress(batch_results, page, batch_num)
-                print(f"📈 Total progress: {page}/1824 pages completed ({len(all_results)} articles found so far)")
+                all_results_file.flush()
+                print(f"📈 Total progress: {page}/{TOTAL_PAGES} pages completed ({total_found} articles found so far)")
                 
                 # Reset batch results and increment batch number
                 batch_results = []
                 batch_num += 1
-            
-            # Small delay between pages
-            time.sleep(1)
         
         # Save any remaining results (if total pages not divisible by 50)
         if batch_results:
             save_progress(batch_results, current_page, batch_num)
+    
+    finally:
+        if context:
+            context.close()
+        if browser:
+            browser.close()
+            print("🔚 Browser closed")
+        if playwright:
+            playwright.stop()
+
+def main():
+    """Main scraping function - concurrent HTTP, with a browser fallback recycled every 50 pages"""
+    # Set up signal handler for Ctrl+C
+    signal.signal(signal.SIGINT, signal_handler)
+    
+    open_results_file()
+    try:
+        print("🚀 Starting EETimes scraper")
+        prewarm_dns()
+        
+        if not asyncio.run(scrape_all_pages()):
+            print("🔄 No results over plain HTTP, falling back to Chromium (new context every 50 pages)...")
+            scrape_all_pages_with_browser()
         
-        print(f"\n✅ Scraping complete! Found {len(all_results)} total articles across all batches.")
+        print(f"\n✅ Scraping complete! Found {total_found} total articles across all batches.")
+        all_results_file.close()
         
-        # Save final combined results
-        if all_results:
-            df_final = pd.DataFrame(all_results, columns=["URL"])
-            df_final = df_final.drop_duplicates(subset="URL")
-            final_filename = "eetimes_semiconductors_COMPLETE_all_pages.csv"
-            df_final.to_csv(final_filename, index=False)
-            print(f"📁 Final combined data saved to {final_filename} ({len(df_final)} unique articles)")
+        # Combined results were written (already de-duplicated) during the run
+        if total_found:
+            os.replace(PARTIAL_FILENAME, COMPLETE_FILENAME)
+            print(f"📁 Final combined data saved to {COMPLETE_FILENAME} ({total_found} unique articles)")
         else:
+            os.remove(PARTIAL_FILENAME)
             print("⚠️  No results found!")
     
     except Exception as e:
         print(f"❌ Fatal error: {e}")
-        # Try to save whatever we have
-        if all_results:
-            save_progress(all_results, current_page)
+        # Everything found so far is already on disk
+        if total_found:
+            print(f"💾 {total_found} articles found so far are in {PARTIAL_FILENAME}")
     
     finally:
-        if driver:
-            driver.quit()
-            print("🔚 Driver closed")
+        all_results_file.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,90 +1,287 @@
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import asyncio
+from selectolax.lexbor import LexborHTMLParser
 import pandas as pd
-from datetime import datetime
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ProcessPoolExecutor
 import time
+import os
+import re
+import shutil
+import sqlite3
+import signal
+import socket
 
-def extract_article_info(url):
-    """Extract article info from EETimes article"""
+# Selectors used on every article, kept in one place
+SEL_TITLE = 'h1'
+SEL_TITLE_FALLBACK = 'title'
+SEL_AUTHOR = '.articleHeader-author a.author.url.fn'
+SEL_AUTHOR_CONTAINER = '.articleHeader-author'
+SEL_DATE = 'span.articleHeader-date'
+SEL_BODY = '.articleBody'
+SEL_BODY_PARAGRAPHS = 'p'
+
+# Any run of whitespace, collapsed to a single space in the article body
+_WS = re.compile(r'\s+')
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# Transient responses retried with exponential backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_AFTER_STATUSES = {429, 503}  # Where the server's Retry-After is honoured, as urllib3 did
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+
+# Everything after the article (recommendations, comments, ads) is never parsed
+BODY_START = b'articleBody'
+ARTICLE_OPEN = b'<article'
+ARTICLE_END = b'</article>'
+NO_CONTENT = "No content found in articleBody"
+
+# Column layout of the extracted articles - bodies can be long, hence large_string
+ARTICLE_SCHEMA = pa.schema([
+    ('title', pa.string()),
+    ('full_content', pa.large_string()),
+    ('publication_date', pa.string()),
+    ('author', pa.string()),
+    ('url', pa.string()),
+    ('status', pa.string())
+])
+
+# Articles already extracted in earlier runs - re-runs skip anything stored as a success
+CACHE_DB = 'article_cache.db'
+
+def open_cache(path=CACHE_DB):
+    """Open (creating if needed) the on-disk article cache"""
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('''CREATE TABLE IF NOT EXISTS articles(
+        url TEXT PRIMARY KEY, title TEXT, full_content TEXT,
+        publication_date TEXT, author TEXT, status TEXT, ts TEXT
+    )''')
+    return conn
+
+def cached_article(conn, url):
+    """Return the cached result for a URL, or None if it still needs fetching"""
+    row = conn.execute(
+        "SELECT title, full_content, publication_date, author FROM articles WHERE url = ? AND status = 'success'",
+        (url,)
+    ).fetchone()
+    if row is None:
+        return None
+    title, full_content, publication_date, author = row
+    return {
+        'title': title,
+        'full_content': full_content,
+        'publication_date': publication_date,
+        'author': author,
+        'url': url,
+        'status': 'success'
+    }
+
+def cache_articles(conn, results):
+    """Store a batch of results in a single transaction"""
+    ts = datetime.now().isoformat()
+    with conn:
+        conn.executemany(
+            'INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(r['url'], r['title'], r['full_content'], r['publication_date'], r['author'], r['status'], ts)
+             for r in results]
+        )
+
+def prewarm_dns(host='www.eetimes.com'):
+    """Resolve the host once before the concurrent fetches start"""
+    try:
+        socket.getaddrinfo(host, 443, socket.AF_INET, socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        print(f"DNS prewarm failed for {host}: {e}")
+
+def create_client():
+    """
+    HTTP/2 client for www.eetimes.com - concurrent requests are multiplexed
+    over a few connections instead of one TCP+TLS handshake per worker
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        headers=HEADERS,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=15.0,
+        follow_redirects=True
+    )
+
+class RateLimiter:
+    """Token bucket shared by all concurrent fetches so the overall request rate stays polite"""
+    
+    def __init__(self, delay):
+        # One token every `delay` seconds, no bursting
+        self.delay = delay
+        self.next_slot = time.monotonic()
+    
+    async def wait(self):
+        """Wait until the caller may send its next request"""
+        now = time.monotonic()
+        slot = max(self.next_slot, now)
+        self.next_slot = slot + self.delay
+        if slot > now:
+            await asyncio.sleep(slot - now)
     
+    def pause(self, seconds):
+        """Hold every caller back for at least `seconds` - the server sent Retry-After"""
+        self.next_slot = max(self.next_slot, time.monotonic() + seconds)
+
+def retry_after_seconds(response):
+    """Seconds the server asked us to wait via Retry-After, or None if it didn't say"""
+    value = response.headers.get('Retry-After', '').strip()
+    if value.isdigit():
+        return int(value)
     try:
-        print(f"Processing: {url}")
-        
-        # Get the webpage with timeout and headers
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, timeout=15, headers=headers)
-        response.encoding = 'utf-8'  # Ensure UTF-8 encoding
-        response.raise_for_status()
-        
-        # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extract title
-        title = soup.find('h1')
-        if title:
-            title = title.get_text().strip()
-        else:
-            title = soup.find('title').get_text().strip()
+        # HTTP-date form
+        return max(0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+async def read_until_article_end(response):
+    """
+    Stream the body and stop once the <article> wrapping articleBody has closed.
+    Returns (content, truncated) - pages where that never happens are read in full.
+    """
+    buf = bytearray()
+    body_at = -1
+    async for chunk in response.aiter_bytes(65536):
+        # Only the new chunk (plus a marker-sized overlap) needs searching for the body
+        search_from = max(0, len(buf) - len(BODY_START))
+        buf.extend(chunk)
+        if body_at == -1:
+            body_at = buf.find(BODY_START, search_from)
+            if body_at == -1:
+                continue
         
-        # Extract author from articleHeader-author class
-        author_container = soup.find(class_='articleHeader-author')
-        if author_container:
-            # Look for author link within the container
-            author_element = author_container.find('a', class_='author url fn')
-            if author_element:
-                author = author_element.get_text().strip()
-            else:
-                # Fallback to any text in the author container
-                author = author_container.get_text().strip()
-        else:
-            author = "Unknown Author"
+        # Teaser <article>s before or inside the body don't count - stop only on a
+        # </article> that isn't matched by an <article> opened after the body started
+        if buf.count(ARTICLE_END, body_at) > buf.count(ARTICLE_OPEN, body_at):
+            return bytes(buf), True
+    return bytes(buf), False
+
+async def fetch_article_html(client, url, rate_limiter, full=False):
+    """
+    GET an article page, retrying connection errors and transient status codes.
+    Every attempt goes through the shared rate limiter, and a Retry-After on
+    429/503 pauses all fetches rather than just this one.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        await rate_limiter.wait()
+        retry_after = None
+        try:
+            async with client.stream('GET', url) as response:
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    response.raise_for_status()
+                    if full:
+                        return await response.aread(), False
+                    return await read_until_article_end(response)
+                if response.status_code in RETRY_AFTER_STATUSES:
+                    retry_after = retry_after_seconds(response)
+        except httpx.TransportError:
+            if attempt == MAX_RETRIES:
+                raise
         
-        # Extract publication date
-        date_element = soup.find('span', class_='articleHeader-date')
-        if date_element:
-            publication_date = date_element.get_text().strip()
+        if retry_after is not None:
+            print(f"Rate limited, pausing {retry_after:.0f}s")
+            rate_limiter.pause(retry_after)
         else:
-            publication_date = "Unknown Date"
-        
-        # Extract full content from articleBody class
-        full_content = ""
-        article_body = soup.find(class_='articleBody')
-        if article_body:
-            # Get all <p> tags within articleBody
-            paragraphs = article_body.find_all('p')
-            content_parts = []
-            for p in paragraphs:
-                text = p.get_text().strip()
-                if text:  # Only add non-empty paragraphs
-                    content_parts.append(text)
-            
-            if content_parts:
-                full_content = ' '.join(content_parts)
+            await asyncio.sleep(BACKOFF_FACTOR * (2 ** attempt))
+
+def parse_article_html(content, url):
+    """Pull title, author, date and body text out of an article page"""
+    
+    # Parse raw bytes with selectolax (Lexbor) - no separate encoding detection pass
+    tree = LexborHTMLParser(content)
+    
+    # Extract title
+    title = tree.css_first(SEL_TITLE)
+    if title:
+        title = title.text().strip()
+    else:
+        title = tree.css_first(SEL_TITLE_FALLBACK).text().strip()
+    
+    # Extract author link from articleHeader-author class in a single lookup
+    author_element = tree.css_first(SEL_AUTHOR)
+    if author_element:
+        author = author_element.text().strip()
+    else:
+        # Fallback to any text in the author container
+        author_container = tree.css_first(SEL_AUTHOR_CONTAINER)
+        author = author_container.text().strip() if author_container else "Unknown Author"
+    
+    # Extract publication date
+    date_element = tree.css_first(SEL_DATE)
+    if date_element:
+        publication_date = date_element.text().strip()
+    else:
+        publication_date = "Unknown Date"
+    
+    # Extract full content from articleBody class
+    full_content = ""
+    article_body = tree.css_first(SEL_BODY)
+    if article_body:
+        # Join all <p> tags within articleBody and normalize whitespace in one pass;
+        # empty paragraphs collapse away with the surrounding spaces
+        paragraphs = article_body.css(SEL_BODY_PARAGRAPHS)
+        full_content = _WS.sub(' ', ' '.join(p.text() for p in paragraphs)).strip()
+    
+    if not full_content:
+        full_content = NO_CONTENT
+    
+    return {
+        'title': title,
+        'full_content': full_content,
+        'publication_date': publication_date,
+        'author': author,
+        'url': url,
+        'status': 'success'
+    }
+
+def ignore_sigint():
+    """Pool initializer - Ctrl+C is handled by the main process, not the parse workers"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+async def parse_off_loop(process_pool, content, url):
+    """Run parse_article_html in the process pool so parsing never blocks the event loop"""
+    if process_pool is None:
+        return parse_article_html(content, url)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(process_pool, parse_article_html, content, url)
+
+async def extract_article_info_async(client, url, rate_limiter=None, process_pool=None):
+    """Extract article info from EETimes article"""
+    
+    if rate_limiter is None:
+        rate_limiter = RateLimiter(0)
+    
+    try:
+        print(f"Processing: {url}")
         
-        # Clean up content
-        if full_content:
-            full_content = ' '.join(full_content.split())  # Normalize whitespace
-        else:
-            full_content = "No content found in articleBody"
+        # Get the webpage over the shared client, stopping after the article itself
+        content, truncated = await fetch_article_html(client, url, rate_limiter)
+        result = await parse_off_loop(process_pool, content, url)
         
-        result = {
-            'title': title,
-            'full_content': full_content,
-            'publication_date': publication_date,
-            'author': author,
-            'url': url,
-            'status': 'success'
-        }
+        # Body wasn't inside <article> after all - fall back to the full page
+        if truncated and result['full_content'] == NO_CONTENT:
+            content, _ = await fetch_article_html(client, url, rate_limiter, full=True)
+            result = await parse_off_loop(process_pool, content, url)
         
         # Print extracted info to terminal
         print(f"✓ Successfully extracted article:")
-        print(f"  Title: {title}")
-        print(f"  Author: {author}")
-        print(f"  Publication Date: {publication_date}")
-        print(f"  Content Length: {len(full_content)} characters")
-        print(f"  Content Preview: {full_content[:150]}...")
+        print(f"  Title: {result['title']}")
+        print(f"  Author: {result['author']}")
+        print(f"  Publication Date: {result['publication_date']}")
+        print(f"  Content Length: {len(result['full_content'])} characters")
+        print(f"  Content Preview: {result['full_content'][:150]}...")
         
         return result
         
@@ -106,14 +303,107 @@ def extract_article_info(url):
         
         return error_result
 
-def process_urls_from_csv(csv_file, url_column='url', delay=1):
+def extract_article_info(url):
+    """Extract a single article, opening a short-lived client for it"""
+    async def run():
+        async with create_client() as client:
+            return await extract_article_info_async(client, url)
+    
+    return asyncio.run(run())
+
+def write_batch(parts_dir, results, written):
+    """
+    Write results[written:] as its own small Parquet file, returns the new written count.
+    Each part has its own footer, so it stays readable even if the run is killed.
+    """
+    if len(results) > written:
+        table = pa.Table.from_pylist(results[written:], schema=ARTICLE_SCHEMA)
+        pq.write_table(table, os.path.join(parts_dir, f'part_{written:07d}.parquet'), compression='zstd')
+    return len(results)
+
+def merge_parts(parts_dir, output_file):
+    """Combine the checkpoint parts (in input order) into one Parquet file and remove them"""
+    parts = sorted(f for f in os.listdir(parts_dir) if f.endswith('.parquet'))
+    with pq.ParquetWriter(output_file, ARTICLE_SCHEMA, compression='zstd') as writer:
+        for part in parts:
+            writer.write_table(pq.read_table(os.path.join(parts_dir, part)))
+    shutil.rmtree(parts_dir)
+
+def save_batch(parts_dir, cache, results, written, fresh):
+    """Cache the newly fetched `fresh` results and write results[written:], returns the new written count"""
+    if fresh:
+        cache_articles(cache, fresh)
+        fresh.clear()
+    return write_batch(parts_dir, results, written)
+
+async def process_urls(urls, parts_dir, cache, results, delay, max_concurrency):
+    """
+    Fetch all URLs over one HTTP/2 client, writing results in batches of 50.
+    I/O stays on the event loop while parsing is spread across all CPU cores.
+    URLs already in the cache are written straight from it without a request.
+    Results are written in input order, like the sequential loop used to.
+    """
+    
+    # Shared limiter keeps requests `delay` seconds apart without idling the other fetches
+    rate_limiter = RateLimiter(delay)
+    sem = asyncio.Semaphore(max_concurrency)
+    
+    async def fetch(client, process_pool, url):
+        async with sem:
+            return await extract_article_info_async(client, url, rate_limiter, process_pool)
+    
+    written = 0
+    fresh = []  # Fetched (not cached) results since the last save
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=ignore_sigint) as process_pool:
+            async with create_client() as client:
+                # Cached URLs resolve immediately; the rest start fetching concurrently
+                pending = []
+                for url in urls:
+                    cached = cached_article(cache, url)
+                    if cached:
+                        pending.append(cached)
+                    else:
+                        pending.append(asyncio.ensure_future(fetch(client, process_pool, url)))
+                skipped = sum(isinstance(item, dict) for item in pending)
+                if skipped:
+                    print(f"Skipping {skipped} URLs already processed in a previous run")
+                
+                # Collect in input order - later fetches keep running while we wait on earlier ones
+                for i, item in enumerate(pending, 1):
+                    if isinstance(item, dict):
+                        result = item
+                    else:
+                        result = await item
+                        fresh.append(result)
+                    print(f"\nProcessed {i}/{len(urls)}")
+                    results.append(result)
+                    
+                    # Save progress every 50 URLs or at the end
+                    if i % 50 == 0 or i == len(urls):
+                        written = save_batch(parts_dir, cache, results, written, fresh)
+                        print(f"  Progress saved ({i}/{len(urls)} completed)")
+    finally:
+        # Also keep whatever finished before a Ctrl+C
+        save_batch(parts_dir, cache, results, written, fresh)
+
+def export_csv(parquet_file, csv_file):
+    """Convert the Parquet output to CSV for tools that expect it"""
+    pacsv.write_csv(pq.read_table(parquet_file), csv_file)
+    print(f"CSV copy saved to: {csv_file}")
+
+def process_urls_from_csv(csv_file, url_column='url', delay=1, max_concurrency=16, csv_copy=True,
+                          cache_file=CACHE_DB):
     """
     Process URLs from a CSV file
     
     Args:
         csv_file (str): Path to CSV file containing URLs
         url_column (str): Name of column containing URLs (default: 'url')
-        delay (int): Delay in seconds between requests (default: 1)
+        delay (int): Minimum delay in seconds between requests across all fetches (default: 1)
+        max_concurrency (int): Number of articles fetched concurrently (default: 16)
+        csv_copy (bool): Also export the Parquet results to CSV when done (default: True)
+        cache_file (str): SQLite cache of already-processed articles (default: 'article_cache.db')
     """
     
     # Read the CSV file
@@ -137,33 +427,19 @@ def process_urls_from_csv(csv_file, url_column='url', delay=1):
     
     # Set up output file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = f'article_extracts_{timestamp}.csv'
-    column_order = ['title', 'full_content', 'publication_date', 'author', 'url', 'status']
+    output_file = f'article_extracts_{timestamp}.parquet'
     
-    # Create empty CSV with headers
-    pd.DataFrame(columns=column_order).to_csv(output_file, index=False, encoding='utf-8')
-    print(f"Progress will be saved to: {output_file}")
+    # Zstd-compressed Parquet checkpoints every 50 rows, merged into output_file at the end
+    parts_dir = f'article_extracts_{timestamp}_parts'
+    os.makedirs(parts_dir)
+    cache = open_cache(cache_file)
+    print(f"Progress will be saved to: {parts_dir}/ (merged into {output_file} when done)")
     
-    # Process each URL with periodic saving
+    # Process URLs concurrently with periodic saving
     results = []
+    prewarm_dns()
     try:
-        for i, url in enumerate(urls, 1):
-            print(f"\nProcessing {i}/{len(urls)}")
-            
-            result = extract_article_info(url)
-            results.append(result)
-            
-            # Save progress every 50 URLs or at the end
-            if i % 50 == 0 or i == len(urls):
-                results_df = pd.DataFrame(results)
-                results_df = results_df[column_order]
-                results_df.to_csv(output_file, index=False, encoding='utf-8')
-                print(f"  Progress saved ({i}/{len(urls)} completed)")
-            
-            # Add delay between requests to be respectful
-            if i < len(urls):
-                print(f"Waiting {delay} seconds...")
-                time.sleep(delay)
+        asyncio.run(process_urls(urls, parts_dir, cache, results, delay, max_concurrency))
                 
     except KeyboardInterrupt:
         print(f"\n\n{'='*60}")
@@ -172,6 +448,11 @@ def process_urls_from_csv(csv_file, url_column='url', delay=1):
         print(f"Processed {len(results)} out of {len(urls)} URLs")
         print(f"Partial results saved to: {output_file}")
         return pd.DataFrame(results)
+    finally:
+        merge_parts(parts_dir, output_file)
+        cache.close()
+        if csv_copy:
+            export_csv(output_file, output_file.replace('.parquet', '.csv'))
     
     # Print final summary
     print(f"\n{'='*60}")